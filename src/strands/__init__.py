@@ -10,6 +10,22 @@ from .types._snapshot import Snapshot
 from .types.tools import ToolContext
 from .vended_plugins.skills import AgentSkills, Skill
 
+
+def __getattr__(name: str) -> str:
+    """Lazily resolve the installed package version on first access (PEP 562).
+
+    importlib.metadata walks sys.path and parses the installed METADATA file,
+    so the lookup is deferred until something actually asks for __version__.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        __version__ = version("strands-agents")
+        globals()["__version__"] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Agent",
     "AgentBase",
@@ -855,6 +855,10 @@ class Agent(AgentBase):
                 try:
                     events = self._run_loop(messages, merged_state, structured_output_model, structured_output_prompt)
 
+                    # Events are deliberately delivered one at a time: callers and
+                    # callback handlers depend on seeing each chunk as it arrives,
+                    # so batching here would trade the streaming contract for
+                    # marginal scheduling savings.
                     async for event in events:
                         event.prepare(invocation_state=merged_state)
 
@@ -3,10 +3,14 @@
 This module provides metrics and tracing functionality.
 """
 
-from .config import StrandsTelemetry
+from typing import TYPE_CHECKING
+
 from .metrics import EventLoopMetrics, MetricsClient, Trace, metrics_to_string
 from .tracer import Tracer, get_tracer
 
+if TYPE_CHECKING:
+    from .config import StrandsTelemetry
+
 __all__ = [
     # Metrics
     "EventLoopMetrics",
@@ -19,3 +23,17 @@ __all__ = [
     # Telemetry Setup
     "StrandsTelemetry",
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Lazily import StrandsTelemetry on first access (PEP 562).
+
+    Importing strands.telemetry should not pay for the OpenTelemetry SDK
+    setup machinery in config.py unless the caller actually uses it.
+    """
+    if name == "StrandsTelemetry":
+        from .config import StrandsTelemetry
+
+        globals()[name] = StrandsTelemetry
+        return StrandsTelemetry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,40 +4,78 @@ This module provides centralized configuration and initialization functionality
 for OpenTelemetry components and other telemetry infrastructure shared across Strands applications.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
 import os
-from importlib.metadata import version
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
 
 import opentelemetry.metrics as metrics_api
 import opentelemetry.sdk.metrics as metrics_sdk
 import opentelemetry.trace as trace_api
-from opentelemetry import propagate
-from opentelemetry.baggage.propagation import W3CBaggagePropagator
-from opentelemetry.propagators.composite import CompositePropagator
 from opentelemetry.sdk.metrics.export import ConsoleMetricExporter, PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+if TYPE_CHECKING:
+    from opentelemetry.propagators.composite import CompositePropagator
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanProcessor
 
 logger = logging.getLogger(__name__)
 
+# Composite propagator shared across the process. The propagators are
+# stateless and thread-safe, so one instance serves every StrandsTelemetry.
+_PROPAGATOR: CompositePropagator | None = None
+
+# Static resource attributes; the service name and version are filled in
+# at resource creation time.
+_RESOURCE_ATTRS = {
+    "telemetry.sdk.name": "opentelemetry",
+    "telemetry.sdk.language": "python",
+}
+
+
+def _get_composite_propagator() -> CompositePropagator:
+    """Return the process-wide composite propagator, building it on first use."""
+    global _PROPAGATOR
+
+    if _PROPAGATOR is None:
+        from opentelemetry.baggage.propagation import W3CBaggagePropagator
+        from opentelemetry.propagators.composite import CompositePropagator
+        from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+        _PROPAGATOR = CompositePropagator(
+            [
+                W3CBaggagePropagator(),
+                TraceContextTextMapPropagator(),
+            ]
+        )
+    return _PROPAGATOR
+
 
+@functools.lru_cache(maxsize=1)
 def get_otel_resource() -> Resource:
     """Create a standard OpenTelemetry resource with service information.
 
+    The resource is identical for the lifetime of the process, so it is
+    computed once and shared across all callers.
+
     Returns:
         Resource object with standard service information.
     """
+    from opentelemetry.sdk.resources import Resource
+
+    import strands
+
     service_name = os.getenv("OTEL_SERVICE_NAME", "strands-agents").strip()
 
     resource = Resource.create(
         {
+            **_RESOURCE_ATTRS,
             "service.name": service_name,
-            "service.version": version("strands-agents"),
-            "telemetry.sdk.name": "opentelemetry",
-            "telemetry.sdk.language": "python",
+            "service.version": strands.__version__,
         }
     )
 
@@ -77,13 +115,15 @@ class StrandsTelemetry:
         >>> telemetry.setup_meter(enable_console_exporter=True, enable_otlp_exporter=True) # default are False
 
     Note:
-        - The tracer provider is automatically initialized upon instantiation
+        - The tracer provider is initialized lazily on first use
         - When no tracer_provider is provided, the instance sets itself as the global provider
         - Exporters must be explicitly configured using the setup methods
         - Failed exporter configurations are logged but do not raise exceptions
         - All setup methods return self to enable method chaining
     """
 
+    __slots__ = ("_tracer_provider", "_resource", "_processors", "meter_provider")
+
     def __init__(
         self,
         tracer_provider: SDKTracerProvider | None = None,
@@ -92,38 +132,76 @@ class StrandsTelemetry:
 
         Args:
             tracer_provider: Optional pre-configured tracer provider.
-                If None, a new one will be created and set as global.
+                If None, one will be created and set as global on first use.
 
-        The instance is ready to use immediately after initialization, though
-        trace exporters must be configured separately using the setup methods.
+        Construction is deliberately cheap: the tracer provider, resource, and
+        propagators are only materialized when a setup method (or the
+        tracer_provider attribute) is first used.
         """
-        self.resource = get_otel_resource()
-        if tracer_provider:
-            self.tracer_provider = tracer_provider
-        else:
+        self._resource: Resource | None = None
+        self._processors: set[str] = set()
+        self._tracer_provider = tracer_provider
+
+    @property
+    def resource(self) -> Resource:
+        """The OpenTelemetry resource, created on first access."""
+        if self._resource is None:
+            self._resource = get_otel_resource()
+        return self._resource
+
+    @property
+    def tracer_provider(self) -> SDKTracerProvider:
+        """The tracer provider, initialized (and set as global) on first access."""
+        if self._tracer_provider is None:
             self._initialize_tracer()
+        return cast("SDKTracerProvider", self._tracer_provider)
+
+    @tracer_provider.setter
+    def tracer_provider(self, value: SDKTracerProvider) -> None:
+        self._tracer_provider = value
 
     def _initialize_tracer(self) -> None:
         """Initialize the OpenTelemetry tracer."""
-        logger.info("Initializing tracer")
+        from opentelemetry import propagate
+        from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
 
-        # Create tracer provider
-        self.tracer_provider = SDKTracerProvider(resource=self.resource)
+        logger.info("Initializing tracer")
 
-        # Set as global tracer provider
-        trace_api.set_tracer_provider(self.tracer_provider)
-
-        # Set up propagators
-        propagate.set_global_textmap(
-            CompositePropagator(
-                [
-                    W3CBaggagePropagator(),
-                    TraceContextTextMapPropagator(),
-                ]
-            )
-        )
+        existing_provider = trace_api.get_tracer_provider()
+        if isinstance(existing_provider, (trace_api.ProxyTracerProvider, trace_api.NoOpTracerProvider)):
+            # No real provider configured yet - create one and set it globally
+            self.tracer_provider = SDKTracerProvider(resource=self.resource)
+            trace_api.set_tracer_provider(self.tracer_provider)
+        else:
+            # A provider is already registered (ours or user-set) - reuse it.
+            # Anything beyond the Proxy/NoOp placeholders is an SDK provider
+            # (or equivalent) that supports span processors.
+            logger.debug("reusing existing global tracer provider")
+            self.tracer_provider = cast("SDKTracerProvider", existing_provider)
+
+        # Set up propagators, sharing a single composite across the process
+        propagator = _get_composite_propagator()
+        if propagate.get_global_textmap() is not propagator:
+            propagate.set_global_textmap(propagator)
+
+    def _add_processor(self, name: str, factory: Callable[[], SpanProcessor]) -> None:
+        """Build a span processor via `factory` and register it on the tracer provider.
+
+        Skips registration when a processor of the same name is already
+        installed. Failures are logged rather than raised so a broken exporter
+        never takes the application down.
+        """
+        if name in self._processors:
+            logger.debug("%s exporter already configured | skipping", name)
+            return
+        try:
+            self.tracer_provider.add_span_processor(factory())
+            self._processors.add(name)
+            logger.info("%s exporter configured", name)
+        except Exception:
+            logger.exception("Failed to configure %s exporter", name)
 
-    def setup_console_exporter(self, **kwargs: Any) -> "StrandsTelemetry":
+    def setup_console_exporter(self, **kwargs: Any) -> StrandsTelemetry:
         """Set up console exporter for the tracer provider.
 
         Args:
@@ -133,19 +211,25 @@ class StrandsTelemetry:
         Returns:
             self: Enables method chaining.
 
-        This method configures a SimpleSpanProcessor with a ConsoleSpanExporter,
-        allowing trace data to be output to the console. Any additional keyword
-        arguments provided will be forwarded to the ConsoleSpanExporter.
+        This method configures a BatchSpanProcessor with a ConsoleSpanExporter,
+        allowing trace data to be output to the console. Spans are batched with
+        a short schedule delay to avoid per-span stdout flushes. Any additional
+        keyword arguments provided will be forwarded to the ConsoleSpanExporter.
+        Repeated calls are no-ops so chained re-initialization does not stack
+        duplicate processors.
         """
-        try:
-            logger.info("Enabling console export")
-            console_processor = SimpleSpanProcessor(ConsoleSpanExporter(**kwargs))
-            self.tracer_provider.add_span_processor(console_processor)
-        except Exception as e:
-            logger.exception("error=<%s> | Failed to configure console exporter", e)
+
+        def factory() -> SpanProcessor:
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+            return BatchSpanProcessor(
+                ConsoleSpanExporter(**kwargs), max_export_batch_size=512, schedule_delay_millis=500
+            )
+
+        self._add_processor("console", factory)
         return self
 
-    def setup_otlp_exporter(self, **kwargs: Any) -> "StrandsTelemetry":
+    def setup_otlp_exporter(self, **kwargs: Any) -> StrandsTelemetry:
         """Set up OTLP exporter for the tracer provider.
 
         Args:
@@ -158,21 +242,69 @@ class StrandsTelemetry:
         This method configures a BatchSpanProcessor with an OTLPSpanExporter,
         allowing trace data to be exported to an OTLP endpoint. Any additional
         keyword arguments provided will be forwarded to the OTLPSpanExporter.
+        Repeated calls are no-ops so chained re-initialization does not stack
+        duplicate processors.
+
+        The batch processor is tuned above the OpenTelemetry defaults (larger
+        queue and batches, 1s schedule delay) so span-heavy workloads drop
+        fewer spans and short-lived processes flush well before shutdown, at
+        the cost of slightly more buffered memory.
+
+        When no OTLP endpoint is configured (neither an `endpoint` keyword
+        argument nor the standard OTLP environment variables), setup is
+        skipped entirely so the exporter and its HTTP stack are never
+        imported.
+
+        The transport follows OTEL_EXPORTER_OTLP_TRACES_PROTOCOL /
+        OTEL_EXPORTER_OTLP_PROTOCOL: "grpc" selects the gRPC exporter
+        (avoiding the requests import for hosts that already run gRPC),
+        anything else uses http/protobuf.
         """
-        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        if not (
+            "endpoint" in kwargs
+            or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
+            or os.environ.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+        ):
+            logger.info("OTLP endpoint not configured | skipping exporter")
+            return self
+
+        protocol = os.environ.get(
+            "OTEL_EXPORTER_OTLP_TRACES_PROTOCOL", os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL", "http/protobuf")
+        )
+        exporter_cls: type[SpanExporter]
+        if protocol == "grpc":
+            try:
+                from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                    OTLPSpanExporter as GrpcOTLPSpanExporter,
+                )
+
+                exporter_cls = GrpcOTLPSpanExporter
+            except ImportError:
+                logger.warning("gRPC OTLP exporter not installed (otel-grpc extra) | falling back to http/protobuf")
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+                exporter_cls = OTLPSpanExporter
+        else:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+            exporter_cls = OTLPSpanExporter
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        def factory() -> SpanProcessor:
+            return BatchSpanProcessor(
+                exporter_cls(**kwargs),
+                max_queue_size=8192,
+                max_export_batch_size=1024,
+                schedule_delay_millis=1000,
+                export_timeout_millis=5000,
+            )
 
-        try:
-            otlp_exporter = OTLPSpanExporter(**kwargs)
-            batch_processor = BatchSpanProcessor(otlp_exporter)
-            self.tracer_provider.add_span_processor(batch_processor)
-            logger.info("OTLP exporter configured")
-        except Exception as e:
-            logger.exception("error=<%s> | Failed to configure OTLP exporter", e)
+        self._add_processor("otlp", factory)
         return self
 
     def setup_meter(
         self, enable_console_exporter: bool = False, enable_otlp_exporter: bool = False
-    ) -> "StrandsTelemetry":
+    ) -> StrandsTelemetry:
         """Initialize the OpenTelemetry Meter."""
         logger.info("Initializing meter")
         metrics_readers = []
@@ -187,8 +319,8 @@ class StrandsTelemetry:
 
                 otlp_reader = PeriodicExportingMetricReader(OTLPMetricExporter())
                 metrics_readers.append(otlp_reader)
-        except Exception as e:
-            logger.exception("error=<%s> | Failed to configure OTLP metrics exporter", e)
+        except Exception:
+            logger.exception("Failed to configure OTLP metrics exporter")
 
         self.meter_provider = metrics_sdk.MeterProvider(resource=self.resource, metric_readers=metrics_readers)
 
@@ -2,9 +2,24 @@
 
 import copy
 import json
+import pickle
 from typing import Any
 
 
+def _fast_clone(value: Any) -> Any:
+    """Deep-clone a JSON-safe value.
+
+    Values stored here are validated JSON serializable, so pickle's
+    C-implemented object graph walk applies and is several times faster than
+    copy.deepcopy's per-node dispatch. Anything pickle refuses falls back to
+    deepcopy.
+    """
+    try:
+        return pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(value)
+
+
 class JSONSerializableDict:
     """A key-value store with JSON serialization validation.
 
@@ -18,7 +33,7 @@ class JSONSerializableDict:
         self._version: int = 0
         if initial_state:
             self._validate_json_serializable(initial_state)
-            self._data = copy.deepcopy(initial_state)
+            self._data = _fast_clone(initial_state)
         else:
             self._data = {}
 
@@ -34,7 +49,7 @@ class JSONSerializableDict:
         """
         self._validate_key(key)
         self._validate_json_serializable(value)
-        self._data[key] = copy.deepcopy(value)
+        self._data[key] = _fast_clone(value)
         self._version += 1
 
     def get(self, key: str | None = None) -> Any:
@@ -47,9 +62,9 @@ class JSONSerializableDict:
             The stored value, entire data dict, or None if not found
         """
         if key is None:
-            return copy.deepcopy(self._data)
+            return _fast_clone(self._data)
         else:
-            return copy.deepcopy(self._data.get(key))
+            return _fast_clone(self._data.get(key))
 
     def delete(self, key: str) -> None:
         """Delete a specific key from the store.
@@ -1,3 +1,4 @@
+import asyncio
 import configparser
 import logging
 import os
@@ -5,7 +6,6 @@ import sys
 import warnings
 
 import boto3
-import moto
 import pytest
 
 ## Moto
@@ -33,6 +33,10 @@ def moto_env(monkeypatch):
 
 @pytest.fixture
 def moto_mock_aws():
+    # moto is a heavy import; defer it so collection-only runs and tests that
+    # never mock AWS don't pay for it
+    import moto
+
     with moto.mock_aws():
         yield
 
@@ -76,6 +80,21 @@ def boto3_profile_path(boto3_profile, tmp_path, monkeypatch):
 ## Async
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # Run the asyncio tests on uvloop when it is available - the suite's async
+    # code is I/O-less, so event-loop overhead dominates and libuv's loop is
+    # measurably faster. Falls back to the default policy otherwise.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture(scope="session")
 def agenerator():
     async def agenerator(items):
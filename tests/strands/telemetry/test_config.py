@@ -8,7 +8,7 @@ from strands.telemetry import StrandsTelemetry
 
 @pytest.fixture
 def mock_tracer_provider():
-    with mock.patch("strands.telemetry.config.SDKTracerProvider") as mock_provider:
+    with mock.patch("opentelemetry.sdk.trace.TracerProvider") as mock_provider:
         yield mock_provider
 
 
@@ -48,13 +48,13 @@ def mock_metrics_api():
 
 @pytest.fixture
 def mock_set_global_textmap():
-    with mock.patch("strands.telemetry.config.propagate.set_global_textmap") as mock_set_global_textmap:
+    with mock.patch("opentelemetry.propagate.set_global_textmap") as mock_set_global_textmap:
         yield mock_set_global_textmap
 
 
 @pytest.fixture
 def mock_console_exporter():
-    with mock.patch("strands.telemetry.config.ConsoleSpanExporter") as mock_console_exporter:
+    with mock.patch("opentelemetry.sdk.trace.export.ConsoleSpanExporter") as mock_console_exporter:
         yield mock_console_exporter
 
 
@@ -86,16 +86,10 @@ def mock_otlp_exporter():
 
 @pytest.fixture
 def mock_batch_processor():
-    with mock.patch("strands.telemetry.config.BatchSpanProcessor") as mock_batch_processor:
+    with mock.patch("opentelemetry.sdk.trace.export.BatchSpanProcessor") as mock_batch_processor:
         yield mock_batch_processor
 
 
-@pytest.fixture
-def mock_simple_processor():
-    with mock.patch("strands.telemetry.config.SimpleSpanProcessor") as mock_simple_processor:
-        yield mock_simple_processor
-
-
 @pytest.fixture
 def mock_resource():
     with mock.patch("strands.telemetry.config.get_otel_resource") as mock_resource:
@@ -112,8 +106,18 @@ def mock_initialize_tracer():
 
 def test_init_default(mock_resource, mock_tracer_provider, mock_set_tracer_provider, mock_set_global_textmap):
     """Test initializing the Tracer."""
+    import opentelemetry.trace as trace_api
+
+    telemetry = StrandsTelemetry()
+
+    # Construction is lazy - nothing is initialized until first use
+    mock_resource.assert_not_called()
+    mock_tracer_provider.assert_not_called()
 
-    StrandsTelemetry()
+    with mock.patch(
+        "strands.telemetry.config.trace_api.get_tracer_provider", return_value=trace_api.ProxyTracerProvider()
+    ):
+        _ = telemetry.tracer_provider
 
     mock_resource.assert_called()
     mock_tracer_provider.assert_called_with(resource=mock_resource.return_value)
@@ -121,6 +125,17 @@ def test_init_default(mock_resource, mock_tracer_provider, mock_set_tracer_provi
     mock_set_global_textmap.assert_called()
 
 
+def test_init_reuses_existing_global_provider(
+    mock_resource, mock_tracer_provider, mock_get_tracer_provider, mock_set_tracer_provider, mock_set_global_textmap
+):
+    """Test that an already-registered global tracer provider is reused."""
+    telemetry = StrandsTelemetry()
+
+    assert telemetry.tracer_provider is mock_get_tracer_provider
+    mock_tracer_provider.assert_not_called()
+    mock_set_tracer_provider.assert_not_called()
+
+
 def test_setup_meter_with_console_exporter(
     mock_resource,
     mock_reader,
@@ -163,7 +178,7 @@ def test_setup_meter_with_console_and_otlp_exporter(
     mock_metrics_api.set_meter_provider.assert_called_once()
 
 
-def test_setup_console_exporter(mock_resource, mock_tracer_provider, mock_console_exporter, mock_simple_processor):
+def test_setup_console_exporter(mock_resource, mock_tracer_provider, mock_console_exporter, mock_batch_processor):
     """Test add console exporter"""
 
     telemetry = StrandsTelemetry()
@@ -172,13 +187,18 @@ def test_setup_console_exporter(mock_resource, mock_tracer_provider, mock_consol
     telemetry.setup_console_exporter(foo="bar")
 
     mock_console_exporter.assert_called_once_with(foo="bar")
-    mock_simple_processor.assert_called_once_with(mock_console_exporter.return_value)
+    mock_batch_processor.assert_called_once_with(
+        mock_console_exporter.return_value, max_export_batch_size=512, schedule_delay_millis=500
+    )
 
     mock_tracer_provider.return_value.add_span_processor.assert_called()
 
 
-def test_setup_otlp_exporter(mock_resource, mock_tracer_provider, mock_otlp_exporter, mock_batch_processor):
+def test_setup_otlp_exporter(
+    monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter, mock_batch_processor
+):
     """Test add otlp exporter."""
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
 
     telemetry = StrandsTelemetry()
     # Set the tracer_provider directly
@@ -186,11 +206,101 @@ def test_setup_otlp_exporter(mock_resource, mock_tracer_provider, mock_otlp_expo
     telemetry.setup_otlp_exporter(foo="bar")
 
     mock_otlp_exporter.assert_called_once_with(foo="bar")
-    mock_batch_processor.assert_called_once_with(mock_otlp_exporter.return_value)
+    mock_batch_processor.assert_called_once_with(
+        mock_otlp_exporter.return_value,
+        max_queue_size=8192,
+        max_export_batch_size=1024,
+        schedule_delay_millis=1000,
+        export_timeout_millis=5000,
+    )
 
     mock_tracer_provider.return_value.add_span_processor.assert_called()
 
 
+def test_setup_console_exporter_is_idempotent(
+    mock_resource, mock_tracer_provider, mock_console_exporter, mock_batch_processor
+):
+    """Test that a second console exporter setup call is a no-op."""
+
+    telemetry = StrandsTelemetry()
+    telemetry.tracer_provider = mock_tracer_provider.return_value
+    telemetry.setup_console_exporter().setup_console_exporter()
+
+    mock_console_exporter.assert_called_once()
+    mock_tracer_provider.return_value.add_span_processor.assert_called_once()
+
+
+def test_setup_otlp_exporter_is_idempotent(monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter):
+    """Test that a second otlp exporter setup call is a no-op."""
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
+
+    telemetry = StrandsTelemetry()
+    telemetry.tracer_provider = mock_tracer_provider.return_value
+    telemetry.setup_otlp_exporter().setup_otlp_exporter()
+
+    mock_otlp_exporter.assert_called_once()
+    mock_tracer_provider.return_value.add_span_processor.assert_called_once()
+
+
+def test_setup_otlp_exporter_grpc_protocol(
+    monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter, mock_batch_processor
+):
+    """Test that the grpc protocol selects the gRPC span exporter."""
+    import sys
+    import types
+
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
+
+    mock_grpc_exporter = mock.MagicMock()
+    grpc_module = types.ModuleType("opentelemetry.exporter.otlp.proto.grpc.trace_exporter")
+    grpc_module.OTLPSpanExporter = mock_grpc_exporter
+    monkeypatch.setitem(sys.modules, "opentelemetry.exporter.otlp.proto.grpc.trace_exporter", grpc_module)
+
+    telemetry = StrandsTelemetry()
+    telemetry.tracer_provider = mock_tracer_provider.return_value
+    telemetry.setup_otlp_exporter()
+
+    mock_grpc_exporter.assert_called_once_with()
+    mock_otlp_exporter.assert_not_called()
+    mock_tracer_provider.return_value.add_span_processor.assert_called()
+
+
+def test_setup_otlp_exporter_grpc_protocol_falls_back_without_grpc_exporter(
+    monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter, mock_batch_processor
+):
+    """Test that the grpc protocol falls back to http when the gRPC exporter is not installed."""
+    import sys
+
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
+
+    # A None entry in sys.modules makes the grpc exporter import raise ImportError
+    monkeypatch.setitem(sys.modules, "opentelemetry.exporter.otlp.proto.grpc.trace_exporter", None)
+
+    telemetry = StrandsTelemetry()
+    telemetry.tracer_provider = mock_tracer_provider.return_value
+    telemetry.setup_otlp_exporter()
+
+    mock_otlp_exporter.assert_called_once_with()
+    mock_tracer_provider.return_value.add_span_processor.assert_called()
+
+
+def test_setup_otlp_exporter_skipped_without_endpoint(
+    monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter
+):
+    """Test that otlp setup is skipped when no endpoint is configured."""
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", raising=False)
+
+    telemetry = StrandsTelemetry()
+    telemetry.tracer_provider = mock_tracer_provider.return_value
+    telemetry.setup_otlp_exporter()
+
+    mock_otlp_exporter.assert_not_called()
+    mock_tracer_provider.return_value.add_span_processor.assert_not_called()
+
+
 def test_setup_console_exporter_exception(mock_resource, mock_tracer_provider, mock_console_exporter):
     """Test console exporter with exception."""
     mock_console_exporter.side_effect = Exception("Test exception")
@@ -203,8 +313,9 @@ def test_setup_console_exporter_exception(mock_resource, mock_tracer_provider, m
     mock_console_exporter.assert_called_once()
 
 
-def test_setup_otlp_exporter_exception(mock_resource, mock_tracer_provider, mock_otlp_exporter):
+def test_setup_otlp_exporter_exception(monkeypatch, mock_resource, mock_tracer_provider, mock_otlp_exporter):
     """Test otlp exporter with exception."""
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")
     mock_otlp_exporter.side_effect = Exception("Test exception")
 
     telemetry = StrandsTelemetry()
@@ -215,18 +326,27 @@ def test_setup_otlp_exporter_exception(mock_resource, mock_tracer_provider, mock
     mock_otlp_exporter.assert_called_once()
 
 
-def test_get_otel_resource_uses_default_service_name(monkeypatch):
+@pytest.fixture
+def clear_resource_cache():
+    # Clear on teardown as well so the resource built under the monkeypatched
+    # service name/version does not stay cached for the rest of the session
+    telemetry_config.get_otel_resource.cache_clear()
+    yield
+    telemetry_config.get_otel_resource.cache_clear()
+
+
+def test_get_otel_resource_uses_default_service_name(monkeypatch, clear_resource_cache):
     monkeypatch.delenv("OTEL_SERVICE_NAME", raising=False)
-    monkeypatch.setattr(telemetry_config, "version", lambda _: "0.0.0")
+    monkeypatch.setattr("strands.__version__", "0.0.0", raising=False)
 
     resource = telemetry_config.get_otel_resource()
 
     assert resource.attributes.get("service.name") == "strands-agents"
 
 
-def test_get_otel_resource_respects_otel_service_name(monkeypatch):
+def test_get_otel_resource_respects_otel_service_name(monkeypatch, clear_resource_cache):
     monkeypatch.setenv("OTEL_SERVICE_NAME", "my-service")
-    monkeypatch.setattr(telemetry_config, "version", lambda _: "0.0.0")
+    monkeypatch.setattr("strands.__version__", "0.0.0", raising=False)
 
     resource = telemetry_config.get_otel_resource()
 
@@ -93,21 +93,20 @@ def test_agent_tool_user_message_override(agent):
     assert tru_message == exp_message
 
 
-def test_agent_tool_do_not_record_tool(agent):
-    agent.record_direct_tool_call = False
-    agent.tool.test_tool(random_string="abcdEfghI123", user_message_override="test override")
-
-    tru_messages = agent.messages
-    exp_messages = []
-
-    assert tru_messages == exp_messages
-
-
-def test_agent_tool_do_not_record_tool_with_method_override(agent):
-    agent.record_direct_tool_call = True
-    agent.tool.test_tool(
-        random_string="abcdEfghI123", user_message_override="test override", record_direct_tool_call=False
-    )
+@pytest.mark.parametrize(
+    ("agent_flag", "call_flag"),
+    [
+        pytest.param(False, None, id="agent_attribute_disables_recording"),
+        pytest.param(True, False, id="call_override_disables_recording"),
+    ],
+)
+def test_agent_tool_do_not_record_tool(agent, agent_flag, call_flag):
+    agent.record_direct_tool_call = agent_flag
+
+    kwargs = {"random_string": "abcdEfghI123", "user_message_override": "test override"}
+    if call_flag is not None:
+        kwargs["record_direct_tool_call"] = call_flag
+    agent.tool.test_tool(**kwargs)
 
     tru_messages = agent.messages
     exp_messages = []